@@ -36,11 +36,47 @@ connconfig = dict(
 """
 
 
+import re
+from multiprocessing.pool import ThreadPool
+
+from ldap3 import SCHEMA, SYNC
+from ldap3.utils.conv import escape_filter_chars
 from ldap3_orm import ObjectDef, Reader
-from ldap3_orm._config import read_config, config
+from ldap3_orm._config import config
 
 from ansible.module_utils.six import iteritems
 from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible_collections.l3o.ldap3_orm.plugins.module_utils.cached_config \
+    import apply_config
+from ansible_collections.l3o.ldap3_orm.plugins.module_utils.pooled_conn \
+    import connect, pool_size
+from ansible_collections.l3o.ldap3_orm.plugins.plugin_utils.real_file \
+    import get_real_file
+
+
+# attributes read from ipaHostGroup and ieee802device entries
+HOSTGROUP_ATTRIBUTES = ["cn", "member", "memberOf"]
+HOST_ATTRIBUTES = ["fqdn", "macAddress"]
+
+# split dn into attribute type and value of its rdn and the parent dn
+RDN = re.compile(r"^([^=]+)=([^,]+),(.+)$")
+
+# number of host groups returned by each page of the paged search
+HOSTGROUP_PAGE_SIZE = 500
+
+# maximum number of hosts looked up within a single (|(fqdn=...)...) filter
+HOST_CHUNK_SIZE = 200
+
+
+def fqdn_filter(fqdns):
+    """Return filter matching any of the given ``fqdns``."""
+    escape = escape_filter_chars
+    parts = ["(|"]
+    extend = parts.extend
+    for fqdn in fqdns:
+        extend(("(fqdn=", escape(fqdn), ")"))
+    parts.append(")")
+    return "".join(parts)
 
 
 class InventoryModule(BaseInventoryPlugin):
@@ -53,37 +89,98 @@ class InventoryModule(BaseInventoryPlugin):
     def parse(self, inventory, loader, path, cache=True):
         BaseInventoryPlugin.parse(self, inventory, loader, path, cache)
         # decrypt inventory if vault-encrypted to `path_full`
-        path_full = loader.get_real_file(path)
-        # the following commands may raise an exception
-        cfg = read_config(path_full)
-        config.apply(cfg)
-        # late import to create connection in respect to loaded config
-        from ldap3_orm.connection import conn
+        path_full = get_real_file(loader, path)
+        # the following command may raise an exception
+        apply_config(path_full)
+        # create (or reuse) connections in respect to loaded config
+        get_info = config.userconfig.get("ldap_get_info", SCHEMA)
+        # paged search results are bound to the connection which issued the
+        # search, hence host groups are read using a non-pooled connection
+        hg_conn = connect(config.url, config.connconfig, SYNC, get_info)
 
         hg_base_dn = config.userconfig.get("hostgroup_base_dn",
                                            "cn=hostgroups," + config.base_dn)
         host_base_dn = config.userconfig.get("host_base_dn",
                                              "cn=computers," + config.base_dn)
+        ieee802device = ObjectDef("ieee802device", hg_conn)
+        ieee802device += HOST_ATTRIBUTES  # fqdn is defined by ipaHost
+
+        def search_chunk(chunk, conn=hg_conn):
+            return Reader(conn, ieee802device, host_base_dn,
+                          fqdn_filter(chunk),
+                          attributes=HOST_ATTRIBUTES).search()
+
         group_bases = {}  # collect one-level of inherited host groups
-        r = Reader(conn, ObjectDef("ipaHostGroup", conn), hg_base_dn)
-        for hg in r.search():
-            group_name = hg.cn.value
-            group = self.inventory.add_group(group_name)
-            for dn in hg.member:
-                host = dn.split(',')[0].replace("fqdn=", '')
-                self.inventory.add_host(host, group)
-
-                rhost = Reader(conn, ObjectDef("ieee802device", conn),
-                               host_base_dn, "(fqdn=" + host +")")
-                if rhost.search():
-                    if rhost[0].macAddress:
-                        self.inventory.set_variable(host, "macaddress",
-                                                    rhost[0].macAddress.value)
+        fqdns = []  # collect host members to look up in batches
+        seen = set()
+        chunk = []
+        chunks = []  # chunks not yet submitted to the thread pool
+        pending = []
+        pool = []  # thread pool and pooled connection
+
+        def submit(chunk):
+            chunks.append(chunk)
+            if not pool:
+                if len(chunks) < 2:
+                    return  # a single chunk is searched using `hg_conn`
+                # the pool reuses the schema already read by `hg_conn`
+                conn = connect(config.url, config.connconfig,
+                               get_info=get_info, info_from=hg_conn.server)
+                pool.extend((ThreadPool(pool_size()), conn))
+            while chunks:
+                pending.append(pool[0].apply_async(
+                    search_chunk, (chunks.pop(0), pool[1])))
+
+        hostgroup = ObjectDef("ipaHostGroup", hg_conn)
+        hostgroup += HOSTGROUP_ATTRIBUTES
+        r = Reader(hg_conn, hostgroup, hg_base_dn,
+                   attributes=HOSTGROUP_ATTRIBUTES)
+        hg_base_dn_lower = hg_base_dn.lower()
+        # lookup mac addresses using one search per chunk of hosts, from the
+        # second chunk on chunks are searched concurrently using the
+        # connection pool while further pages of host groups are read
+        try:
+            for hg in r.search_paged(HOSTGROUP_PAGE_SIZE):
+                group_name = hg.cn.value
+                group = self.inventory.add_group(group_name)
+                for dn in hg.member:
+                    m = RDN.match(dn)
+                    if not m or m.group(1).lower() != "fqdn":
+                        continue  # e.g. nested host groups
+                    host = m.group(2)
+                    if host not in seen:
+                        seen.add(host)
+                        fqdns.append(host)
+                        chunk.append(host)
+                        if len(chunk) == HOST_CHUNK_SIZE:
+                            submit(chunk)
+                            chunk = []
+                    self.inventory.add_host(host, group)
 
                 for hg_member in hg.memberOf:
-                    if hg_member.endswith(hg_base_dn):
-                        hg_name = hg_member.split(',')[0].replace("cn=", '')
-                        group_bases.setdefault(hg_name, []).append(group_name)
+                    m = RDN.match(hg_member)
+                    if m and m.group(3).lower() == hg_base_dn_lower:
+                        group_bases.setdefault(m.group(2),
+                                               []).append(group_name)
+            if chunk:
+                submit(chunk)
+
+            results = [search_chunk(c) for c in chunks]
+            results += [result.get() for result in pending]
+            mac_by_host = {}
+            for entries in results:
+                for entry in entries:
+                    if entry.macAddress:
+                        mac_by_host[entry.fqdn.value] = entry.macAddress.value
+        finally:
+            if pool:
+                pool[0].close()
+                pool[0].join()
+
+        for host in fqdns:
+            if host in mac_by_host:
+                self.inventory.set_variable(host, "macaddress",
+                                            mac_by_host[host])
 
         # update host groups with one-level of indirect host members
         for name, groups in iteritems(group_bases):
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Christian Felder <webmaster@bsm-felder.de>
+# GNU Lesser General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/lgpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import threading
+
+from ldap3_orm._config import CONFIGDIR, config, read_config
+
+
+# settings of the config singleton, i.e. its non-callable class attributes
+# (determined before any configuration has been applied)
+_ATTRIBUTES = tuple(
+    attr for attr, value in vars(config).items()
+    if not (attr.startswith("__") or callable(value) or
+            isinstance(value, (classmethod, staticmethod))))
+
+
+def _snapshot():
+    # copy dictionaries which are modified in place by config.apply
+    return dict((attr, dict(value) if isinstance(value, dict) else value)
+                for attr, value in ((attr, getattr(config, attr))
+                                    for attr in _ATTRIBUTES))
+
+
+def _restore(snapshot):
+    for attr, value in snapshot.items():
+        setattr(config, attr, dict(value) if isinstance(value, dict)
+                else value)
+
+
+_defaults = _snapshot()  # config singleton before applying any configuration
+_snapshots = {}  # (path, mtime, size) -> applied config singleton
+_snapshots_lock = threading.Lock()
+
+
+def apply_config(path):
+    """Read the ldap3_orm configuration file ``path`` and apply it to the
+    :py:class:`~ldap3_orm.config.config` singleton.
+
+    The applied configuration is cached by path, modification time and size
+    of the configuration file, i.e. the file is read (and passwords are
+    retrieved from ``keyring``) only once unless it has changed.
+
+    :py:meth:`config.apply <ldap3_orm.config.config.apply>` applies a
+    configuration only once per process. Therefore the singleton is reset
+    to its defaults (including its ``_applied`` flag) before applying
+    another configuration file.
+
+    """
+    # resolve filenames in respect to the fallback of read_config
+    if not os.path.isfile(path) and os.path.basename(path) == path:
+        path = os.path.join(CONFIGDIR, path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime, stat.st_size)
+    with _snapshots_lock:
+        if key not in _snapshots:
+            _restore(_defaults)
+            config.apply(read_config(path))
+            _snapshots[key] = _snapshot()
+        _restore(_snapshots[key])
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Christian Felder <webmaster@bsm-felder.de>
+# GNU Lesser General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/lgpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from ldap3 import NONE, REUSABLE, SCHEMA, Server
+from ldap3_orm._connection import Connection
+
+
+_connections = {}  # connections already created in this process
+
+
+def pool_size():
+    """Return the number of pooled connections, may be set by the
+    ``L3O_LDAP_POOL`` environment variable (default: 8)."""
+    return int(os.environ.get("L3O_LDAP_POOL", "8"))
+
+
+def connect(url, connconfig, client_strategy=REUSABLE, get_info=SCHEMA,
+            info_from=None):
+    """Create :py:class:`ldap3_orm.Connection
+    <ldap3.core.connection.Connection>` for ``url`` which uses a pool of
+    connections by default.
+
+    Connections are created once per ``url``, user, ``client_strategy`` and
+    ``get_info`` and reused on subsequent calls. Keyword arguments given in
+    ``connconfig`` have preference over the pool settings used by default.
+
+    ``get_info`` is passed to :py:class:`~ldap3.core.server.Server`, use
+    ``ldap3.NONE`` to skip reading the schema if no models are generated.
+    Schema and server info of the :py:class:`~ldap3.core.server.Server`
+    ``info_from`` are reused instead of reading them again if given.
+
+    """
+    connconfig = connconfig or {}
+    key = (url, connconfig.get("user"), client_strategy, get_info)
+    if key not in _connections:
+        # use a single server, a server pool of one server would retry
+        # forever instead of raising connection errors
+        if info_from is not None and info_from.schema:
+            server = Server(url, get_info=NONE)
+            server.attach_schema_info(info_from.schema)
+            if info_from.info:
+                server.attach_dsa_info(info_from.info)
+        else:
+            server = Server(url, get_info=get_info)
+        kwargs = dict(client_strategy=client_strategy, auto_bind=True)
+        if client_strategy == REUSABLE:
+            # ldap3 shares pools by name within the process, hence the name
+            # must be unique for each cached connection
+            kwargs.update(pool_name="l3o-%s-%s-%s" % (url, key[1], get_info),
+                          pool_size=pool_size(), pool_lifetime=600,
+                          pool_keepalive=30)
+        kwargs.update(connconfig)
+        conn = Connection(server, **kwargs)
+        if not conn.strategy.sync and not conn.server.schema:
+            # pool workers read the schema lazily, load it in advance to
+            # allow creating ObjectDefs right after binding
+            conn.server.get_info_from_server(conn)
+        _connections[key] = conn
+    return _connections[key]
@@ -27,6 +27,10 @@ options:
       - ldap3-orm configuration file (name or full qualified path)
       - See U(http://code.bsm-felder.de/doc/ldap3-orm/latest/classes/config.html)
         for an overview.
+      - The schema is read from the server only when a model is generated
+        from I(objectClass) and I(attributes). The C(get_info) parameter of
+        the ldap3 C(Server) may be set using C(userconfig['ldap_get_info']),
+        e.g. C(userconfig = dict(ldap_get_info="ALL")).
     required: True
     type: str
   dn:
@@ -103,6 +107,11 @@ EXAMPLES = r'''
 #    user = "cn=Directory Manager",
 #    password = "KL!p5SPi;zMhsgbL@utAFVMWuLDoy!2xJE1@zJ3Gl3o=",
 #)
+
+# optionally override the ldap3 Server get_info parameter, e.g.
+#userconfig = dict(
+#    ldap_get_info = "ALL",
+#)
 '''
 
 
@@ -126,10 +135,14 @@ from ansible.module_utils.six import string_types
 
 try:
     import ldap3_orm
-    from ldap3 import ALL_ATTRIBUTES, BASE
+    from ldap3 import BASE, NONE, SCHEMA, SYNC
+    from ldap3.core.exceptions import LDAPOperationResult
     from ldap3_orm import EntryType
-    from ldap3_orm._config import read_config, config
-    from ldap3_orm._connection import create_connection
+    from ldap3_orm._config import config
+    from ansible_collections.l3o.ldap3_orm.plugins.module_utils.cached_config \
+        import apply_config
+    from ansible_collections.l3o.ldap3_orm.plugins.module_utils.pooled_conn \
+        import connect
 except ImportError:
     IMPORT_ERROR = traceback.format_exc()
     ldap3_orm = None
@@ -149,45 +162,69 @@ class LdapEntry(object):
         self.attributes = self.module.params.get("attributes")
 
         # create config singleton and connection
-        config.apply(read_config(self.module.params.get("config")))
-        self.connection = create_connection(config.url, config.connconfig)
+        apply_config(self.module.params.get("config"))
+        # the schema is only required for generating models
+        get_info = SCHEMA if self._uses_model() else NONE
+        get_info = config.userconfig.get("ldap_get_info", get_info)
+        # each module invocation runs in a process of its own and relies on
+        # synchronous results, hence a reusable pool is not used here
+        self.connection = connect(config.url, config.connconfig, SYNC,
+                                  get_info)
 
         if self.state == "present":
             self.present()
         if self.state == "absent":
             self.absent()
 
+    def _uses_model(self):
+        return bool(self.object_classes and self.dn and
+                    self.module.params["attributes"])
+
     def _get_entry(self):
-        if self.object_classes and self.dn and self.module.params["attributes"]:
+        # return EntryType instance if dn may be generated from attributes
+        if self._uses_model():
             cls = EntryType(self.dn, self.object_classes, self.connection)
-            entry = cls(**self.module.params["attributes"])
-            search_dn = entry.entry_dn
-        else:
-            entry = None
-            search_dn = self.dn
-        self.connection.search(search_dn, "(objectClass=top)", BASE,
-                               attributes=ALL_ATTRIBUTES)
-
-        # return EntryType and search result
+            return cls(**self.module.params["attributes"])
+        return None
+
+    def _exists(self, dn):
+        try:
+            self.connection.compare(dn, "objectClass", "top")
+        except LDAPOperationResult:
+            pass  # raised if raise_exceptions is set, result is still set
+        result = self.connection.result
+        if result["description"] in ("compareTrue", "compareFalse"):
+            return True
+        if result["description"] == "noSuchObject":
+            return False
+        self.module.fail_json(
+            msg="Could not compare dn '{}'. {}".format(dn, result["message"]))
+
+    def _fetch_for_diff(self, dn, attributes):
+        # read only attributes required for comparison
+        attributes = ["objectClass"] + [attr for attr in attributes
+                                        if attr != "objectClass"]
+        self.connection.search(dn, "(objectClass=*)", BASE,
+                               attributes=attributes)
         if self.connection.entries:
-            return entry, self.connection.entries[0]
-        return entry, None
+            return self.connection.entries[0]
+        return None
 
     def absent(self):
-        origin = self._get_entry()[1]
-        if origin:
-            if not self.module.check_mode and not self.connection.delete(
-                    origin.entry_dn):
+        entry = self._get_entry()
+        dn = entry.entry_dn if entry else self.dn
+        if self._exists(dn):
+            if not self.module.check_mode and not self.connection.delete(dn):
                 self.module.fail_json(
                     msg="Could not delete dn '{}'. {}".format(
-                        origin.entry_dn, self.connection.result["message"]))
+                        dn, self.connection.result["message"]))
 
             self.results["changed"] = True
-            self.results["actions"].append(
-                "Deleted dn '{}'".format(origin.entry_dn))
+            self.results["actions"].append("Deleted dn '{}'".format(dn))
 
     def present(self):
-        entry, origin = self._get_entry()
+        entry = self._get_entry()
+        origin = self._fetch_for_diff(entry.entry_dn, entry.entry_attributes)
         # if entry already exists, update existing entry
         if origin:
             origin = origin.entry_writable()
@@ -197,15 +234,21 @@ class LdapEntry(object):
             if missing_classes:
                 origin.objectClass += missing_classes
             # update values in origin from new instance entry
-            for attr in entry.entry_attributes:
-                if attr in "objectClass":
+            # (changes including missing classes are committed at once)
+            # compare plain values, attribute names are case-insensitive
+            origin_values = dict(
+                (attr.lower(), values) for attr, values
+                in origin.entry_attributes_as_dict.items())
+            for attr, values in entry.entry_attributes_as_dict.items():
+                if attr == "objectClass":
                     continue
-                attribute = getattr(entry, attr)
-                if getattr(origin, attr) != attribute:
-                    setattr(origin, attr, attribute.value)
+                if set(values) != set(origin_values.get(attr.lower(), ())):
+                    setattr(origin, attr, values)
 
             if origin.entry_changes:
-                if not self.module.check_mode and not origin.entry_commit_changes():
+                # do not refresh origin after modification, it is not used
+                if not self.module.check_mode and not \
+                        origin.entry_commit_changes(refresh=False):
                     self.module.fail_json(
                         msg="Could not modify dn '{}'. {}".format(
                             entry.entry_dn, self.connection.result["message"]))
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Christian Felder <webmaster@bsm-felder.de>
+# GNU Lesser General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/lgpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import os
+import threading
+
+
+_real_files = {}  # (path, sha1 of content) -> decrypted real file
+_real_files_lock = threading.Lock()
+
+
+def get_real_file(loader, file_path):
+    """Return the real file of ``file_path`` decrypted by ``loader`` if
+    vault-encrypted.
+
+    The decrypted file is cached by path and checksum of its content, i.e.
+    the same file is decrypted only once unless it has changed. The cache
+    lives in the calling process, i.e. it is useful for inventory plugins
+    but not for action plugins which run in a worker process per task.
+
+    """
+    path = loader.path_dwim(file_path)
+    if not os.path.isfile(path):
+        return loader.get_real_file(file_path)
+
+    with open(path, "rb") as fd:
+        key = (path, hashlib.sha1(fd.read()).digest())
+    with _real_files_lock:
+        real_file = _real_files.get(key)
+        if real_file is None or not os.path.isfile(real_file):
+            real_file = _real_files[key] = loader.get_real_file(file_path)
+    return real_file